@@ -1,5 +1,5 @@
 # Usando JuMP o Pupl, determine el programa de env´ıos ´optimo en la red de distribución
-import pulp as pl
+from lab2.modelos import transporte
 
 # Conjuntos
 refinerias = ['R1', 'R2', 'R3']
@@ -32,30 +32,18 @@ distancias = {
     ('R3', 'A3'): 120
 }
 
-# Crear modelo
-model = pl.LpProblem("Transporte", pl.LpMinimize)
+# Costo por millón: millones * km * $0.1 / 1000
+costos = {ruta: d*0.1 for ruta, d in distancias.items()}
 
-# Variables
-x = pl.LpVariable.dicts("x", distancias, lowBound=0)
 
-# Función objetivo: costo total (millones * km * $0.1 / 1000)
-model += pl.lpSum(x[i,j]*distancias[i,j]*0.1 for (i,j) in distancias)
+if __name__ == "__main__":
+    # Resolver
+    res = transporte(oferta, demanda, costos)
 
-# Restricciones de oferta
-for i in refinerias:
-    model += pl.lpSum(x[i,j] for (ii,j) in distancias if ii == i) <= oferta[i], f"Oferta_{i}"
-
-# Restricciones de demanda
-for j in areas:
-    model += pl.lpSum(x[i,j] for (i,jj) in distancias if jj == j) == demanda[j], f"Demanda_{j}"
-
-# Resolver
-model.solve()
-
-# Resultado
-print(f"Status: {pl.LpStatus[model.status]}")
-print("Envíos óptimos:")
-for var in x:
-    if x[var].varValue > 0:
-        print(f"{var}: {x[var].varValue:.2f} millones")
-print(f"Costo total: ${pl.value(model.objective):.2f}")
+    # Resultado
+    print(f"Status: {res['status']}")
+    print("Envíos óptimos:")
+    for ruta, cantidad in res["envios"].items():
+        if cantidad > 0:
+            print(f"{ruta}: {cantidad:.2f} millones")
+    print(f"Costo total: ${res['costo']:.2f}")
@@ -3,7 +3,7 @@
 #es de $1.50 desde la refiner´ıa 1 y de $2.20 desde la refiner´ıa 2. La refiner´ıa 3 puede enviar su producci´on excedente a
 #otros procesos qu´ımicos dentro de la planta.
 #Formule y resuelva de nuevo el programa ´optimo de env´ıos
-import pulp as pl
+from lab2.modelos import transporte
 
 # Conjuntos
 refinerias = ['R1', 'R2', 'R3']
@@ -44,50 +44,24 @@ costos_camion = {
     ('R2', 'A2'): 22
 }
 
-# Modelo
-model = pl.LpProblem("Transporte_modificado", pl.LpMinimize)
+# Costo por millón en oleoducto: millones * km * $0.1 / 1000
+costos = {ruta: d*0.1 for ruta, d in distancias.items()}
 
-# Variables oleoducto
-x = pl.LpVariable.dicts("x", distancias, lowBound=0)
 
-# Variables camión (sólo para R1 y R2 a A1, A2)
-y = pl.LpVariable.dicts("y", costos_camion, lowBound=0)
+if __name__ == "__main__":
+    # Resolver (oleoducto + camión)
+    res = transporte(oferta, demanda_mod, costos, costos_camion)
 
-# Función objetivo: costo total (oleoducto + camión)
-model += (
-    pl.lpSum(x[i,j]*distancias[i,j]*0.1 for (i,j) in distancias) +
-    pl.lpSum(y[i,j]*costos_camion[i,j] for (i,j) in costos_camion)
-)
+    # Resultados
+    print(f"Status: {res['status']}")
+    print("Envíos por oleoducto:")
+    for ruta, cantidad in res["envios"].items():
+        if cantidad > 0:
+            print(f"{ruta}: {cantidad:.2f} millones")
 
-# Restricciones de oferta
-for i in refinerias:
-    model += (
-        pl.lpSum(x[i,j] for (ii,j) in distancias if ii == i) +
-        pl.lpSum(y[i,j] for (ii,j) in costos_camion if ii == i)
-        <= oferta[i]
-    ), f"Oferta_{i}"
+    print("\nEnvíos por camión:")
+    for ruta, cantidad in res["envios_camion"].items():
+        if cantidad > 0:
+            print(f"{ruta}: {cantidad:.2f} millones")
 
-# Restricciones de demanda
-for j in areas:
-    model += (
-        pl.lpSum(x[i,j] for (i,jj) in distancias if jj == j) +
-        pl.lpSum(y[i,j] for (i,jj) in costos_camion if jj == j)
-        == demanda_mod[j]
-    ), f"Demanda_{j}"
-
-# Resolver
-model.solve()
-
-# Resultados
-print(f"Status: {pl.LpStatus[model.status]}")
-print("Envíos por oleoducto:")
-for var in x:
-    if x[var].varValue > 0:
-        print(f"{var}: {x[var].varValue:.2f} millones")
-
-print("\nEnvíos por camión:")
-for var in y:
-    if y[var].varValue > 0:
-        print(f"{var}: {y[var].varValue:.2f} millones")
-
-print(f"\nCosto total: ${pl.value(model.objective):.2f}")
+    print(f"\nCosto total: ${res['costo']:.2f}")
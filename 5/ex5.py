@@ -1,74 +1,4 @@
-import math
-import matplotlib.pyplot as plt
-
-# -------------------------
-# MÉTODO DE BISECCIÓN
-# -------------------------
-def bisection(f, a, b, max_iter=100, tol=1e-7):
-    if f(a) * f(b) >= 0:
-        raise ValueError("f(a) y f(b) deben tener signos opuestos")
-
-    approximations = []
-
-    for _ in range(max_iter):
-        c = (a + b) / 2
-        approximations.append(c)
-
-        if abs(f(c)) < tol or abs(b - a) / 2 < tol:
-            return approximations, c
-
-        if f(a) * f(c) < 0:
-            b = c
-        else:
-            a = c
-
-    return approximations, c
-
-
-# -------------------------
-# MÉTODO DE LA SECANTE
-# -------------------------
-def secant(f, x0, x1, max_iter=100, tol=1e-7):
-    approximations = [x0, x1]
-
-    for _ in range(max_iter):
-        fx0 = f(x0)
-        fx1 = f(x1)
-
-        if abs(fx1 - fx0) < 1e-12:
-            break  # evitar división por cero
-
-        x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
-        approximations.append(x2)
-
-        if abs(x2 - x1) < tol:
-            return approximations, x2
-
-        x0, x1 = x1, x2
-
-    return approximations, x2
-
-
-# -------------------------
-# MÉTODO DE NEWTON-RAPHSON
-# -------------------------
-def newton(f, df, x0, max_iter=100, tol=1e-7):
-    approximations = [x0]
-
-    for _ in range(max_iter):
-        dfx = df(x0)
-        if abs(dfx) < 1e-12:
-            break  # evitar división por cero
-
-        x1 = x0 - f(x0) / dfx
-        approximations.append(x1)
-
-        if abs(x1 - x0) < tol:
-            return approximations, x1
-
-        x0 = x1
-
-    return approximations, x1
+from lab2 import bisection, secant, newton, find_roots
 
 
 # -------------------------
@@ -82,12 +12,10 @@ def dg(x):
 
 
 if __name__ == "__main__":
-    print("=== EJERCICIO 5 ===")
+    from lab2.graficas import plot_convergence
 
-    def g(x): return x**2 + 1 / (x - 7)
-    def dg(x): return 2*x - 1 / (x - 7)**2
+    print("=== EJERCICIO 5 ===")
 
-    
     print("\n--- MÉTODO DE BISECCIÓN ---")
     aprox_bis, root_bis = bisection(g, -2, 0)
     print(f"Raíz: {root_bis:.10f}, Iteraciones: {len(aprox_bis)}")
@@ -100,14 +28,17 @@ if __name__ == "__main__":
     aprox_newton, root_newton = newton(g, dg, -1.5)
     print(f"Raíz: {root_newton:.10f}, Iteraciones: {len(aprox_newton)}")
 
+    print("\n--- RAÍCES EN [-10, 10] (polo en x = 7) ---")
+    print("Raíces:", ", ".join(f"{r:.10f}" for r in
+                               find_roots(g, -10, 10, singularities=[7])))
+    try:
+        bisection(g, 6.99, 7.5)
+    except ValueError as e:
+        print(f"bisection(g, 6.99, 7.5): {e}")
+
     # Graficar convergencia
-    plt.plot(aprox_bis, label="Bisección", marker='o')
-    plt.plot(aprox_sec, label="Secante", marker='x')
-    plt.plot(aprox_newton, label="Newton-Raphson", marker='s')
-    plt.xlabel("Iteración")
-    plt.ylabel("Aproximación")
-    plt.title("Convergencia de métodos para g(x)")
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
-    plt.show()
+    plot_convergence([
+        ("Bisección", aprox_bis, 'o'),
+        ("Secante", aprox_sec, 'x'),
+        ("Newton-Raphson", aprox_newton, 's'),
+    ], title="Convergencia de métodos para g(x)")
@@ -0,0 +1,99 @@
+"""
+Generadores de instancias reproducibles para los benchmarks.
+
+Cada generador recibe el tamaño y una semilla; la misma semilla produce
+siempre la misma instancia.
+"""
+import numpy as np
+
+
+# -------------------------
+# Polinomios (raíces en R)
+# -------------------------
+def polinomios(cantidad, seed=0):
+    """
+    Lote de cúbicas p(x) = x^3 + a x + b con a > 0, que tienen una única
+    raíz real dentro de [-R, R] con R = 1 + |b|.
+    Devuelve una lista de (f, df, a, b, R).
+    """
+    rng = np.random.default_rng(seed)
+    casos = []
+    for a, b in zip(rng.uniform(0.5, 5, cantidad), rng.uniform(-20, 20, cantidad)):
+        a, b = float(a), float(b)
+        casos.append((lambda x, a=a, b=b: x**3 + a*x + b,
+                      lambda x, a=a: 3*x**2 + a,
+                      a, b, 1 + abs(b)))
+    return casos
+
+
+# -------------------------
+# Sistemas no lineales
+# -------------------------
+def broyden_tridiagonal(n):
+    """
+    Sistema tridiagonal de Broyden, F: R^n → R^n:
+      F_i = (3 - 2 x_i) x_i - x_{i-1} - 2 x_{i+1} + 1
+    Devuelve (F, J_denso, J_disperso, patron, x0). F está vectorizada:
+    acepta x (n,) o un lote (m, n).
+    """
+    def F(x):
+        r = (3 - 2*x) * x + 1
+        r[..., 1:] -= x[..., :-1]
+        r[..., :-1] -= 2 * x[..., 1:]
+        return r
+
+    def J_dense(x):
+        Jx = np.diag(3 - 4*x)
+        Jx[np.arange(1, n), np.arange(n - 1)] = -1
+        Jx[np.arange(n - 1), np.arange(1, n)] = -2
+        return Jx
+
+    def J_sparse(x):
+        from scipy.sparse import diags
+        return diags([-np.ones(n - 1), 3 - 4*x, -2*np.ones(n - 1)],
+                     [-1, 0, 1], format="csc")
+
+    def patron():
+        from scipy.sparse import diags
+        return diags([np.ones(n - 1), np.ones(n), np.ones(n - 1)], [-1, 0, 1])
+
+    return F, J_dense, J_sparse, patron, -np.ones(n)
+
+
+def puntos_iniciales(m, n=3, radio=2.0, seed=0):
+    """m puntos iniciales uniformes en [-radio, radio]^n."""
+    return np.random.default_rng(seed).uniform(-radio, radio, size=(m, n))
+
+
+# -------------------------
+# Modelos de PuLP
+# -------------------------
+def red_transporte(origenes, destinos, densidad=0.7, seed=0):
+    """
+    Red de transporte aleatoria factible: capacidades totales mayores que
+    la demanda y cada destino alcanzable desde al menos un origen.
+    Devuelve (oferta, demanda, costos) en el formato de lab2.modelos.
+    """
+    rng = np.random.default_rng(seed)
+    O = [f"R{i+1}" for i in range(origenes)]
+    D = [f"A{j+1}" for j in range(destinos)]
+    demanda = {j: int(d) for j, d in zip(D, rng.integers(1, 10, destinos))}
+    total = sum(demanda.values())
+    capacidad = rng.uniform(1.0, 2.0, origenes)
+    capacidad *= 1.5 * total / capacidad.sum()
+    oferta = {i: float(c) for i, c in zip(O, capacidad)}
+
+    costos = {}
+    for j in D:
+        cerca = rng.random(origenes) < densidad
+        # los orígenes "lejanos" también se conectan pero con costo alto,
+        # así la red siempre es factible
+        for i, c, lejos in zip(O, rng.uniform(50, 300, origenes), ~cerca):
+            costos[i, j] = float(c) * (10 if lejos else 1)
+    return oferta, demanda, costos
+
+
+def matriz_costos(n, m, seed=0):
+    """Matriz de costos enteros n×m (lista de listas) con n ≤ m."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(1, 100, size=(n, m)).tolist()
@@ -0,0 +1,261 @@
+"""
+Benchmarks de los solvers de lab2. Requieren el paquete instalado con
+todos los extras (pip install -e ".[all]").
+
+    python benchmarks/run.py                       # corre y compara con baseline.json
+    python benchmarks/run.py --quick               # sólo los tamaños pequeños
+    python benchmarks/run.py --save-baseline       # guarda los resultados como baseline
+    python benchmarks/run.py --only raices,sistemas --output resultados.json
+
+Cada caso registra tiempo de pared (mínimo de --repeat corridas), memoria
+pico (tracemalloc, en una corrida aparte) y contadores de evaluaciones.
+Contra el baseline se marca regresión si un contador aumenta o si el
+tiempo o la memoria crecen más de --threshold veces (con un piso de 10 ms
+y 64 KiB para ignorar ruido). Los tiempos dependen de la máquina: el
+baseline debe generarse en la misma máquina donde se compara.
+Devuelve código de salida 1 si hay regresiones.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import instancias
+from lab2 import (bisection, secant, newton, newton_multidimensional,
+                  newton_multidimensional_batch, transporte, asignacion,
+                  MemoryTracer)
+
+ROOT = Path(__file__).resolve().parent
+
+BASELINE = ROOT / "baseline.json"
+COUNTERS = ("nfev", "njev", "nfact", "iterations")
+
+
+def measure(run, repeat):
+    """
+    Ejecuta run() una vez de calentamiento (imports perezosos, cachés),
+    repeat veces cronometradas y una más bajo tracemalloc.
+    run devuelve un dict de contadores. Devuelve el dict con time (s,
+    mínimo) y peak_kib añadidos.
+    """
+    run()
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        counters = run()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {**counters, "time": best, "peak_kib": peak / 1024}
+
+
+# -------------------------
+# Casos
+# -------------------------
+def _contar(f, counter):
+    def wrapped(x):
+        counter[0] += 1
+        return f(x)
+    return wrapped
+
+
+def casos_raices(quick):
+    metodos = {
+        "bisection": lambda f, df, R: bisection(f, -R, R),
+        "secant": lambda f, df, R: secant(f, -R, R),
+        "newton": lambda f, df, R: newton(f, df, R),
+        "newton_line_search": lambda f, df, R: newton(f, df, R, line_search=True),
+    }
+    for cantidad in ([10, 100] if quick else [10, 100, 1000]):
+        polys = instancias.polinomios(cantidad)
+        for nombre, metodo in metodos.items():
+            def run(metodo=metodo, polys=polys):
+                nfev, njev, iters = [0], [0], 0
+                for f, df, _, _, R in polys:
+                    aprox, _ = metodo(_contar(f, nfev), _contar(df, njev), R)
+                    iters += len(aprox)
+                return {"nfev": nfev[0], "njev": njev[0], "iterations": iters}
+            yield "raices", nombre, "python", cantidad, run
+
+
+def casos_sistemas(quick):
+    dense_sizes = [10, 100] if quick else [10, 100, 1000]
+    sparse_sizes = [1000, 10000] if quick else [1000, 10000, 100000]
+
+    def solver(n, J, **kw):
+        F, *_, x0 = instancias.broyden_tridiagonal(n)
+
+        def run():
+            _, _, info = newton_multidimensional(F, J, x0, full_output=True, **kw)
+            return {k: info[k] for k in COUNTERS}
+        return run
+
+    for n in dense_sizes:
+        _, Jd, _, _, _ = instancias.broyden_tridiagonal(n)
+        for backend, kw in [("dense", {}), ("chord", {"method": "chord"}),
+                            ("broyden", {"method": "broyden"}),
+                            ("fd_dense", {"J": None})]:
+            kw = dict(kw)
+            J = kw.pop("J", Jd)
+            yield "sistemas", "newton_multidimensional", backend, n, solver(n, J, **kw)
+
+    for n in sparse_sizes:
+        _, _, Js, patron, _ = instancias.broyden_tridiagonal(n)
+        for backend, J, kw in [
+                ("sparse_lu", Js, {}),
+                ("sparse_chord", Js, {"method": "chord"}),
+                ("gmres", Js, {"linear_solver": "gmres"}),
+                ("matrix_free", None, {"linear_solver": "lgmres", "matrix_free": True}),
+                ("fd_colored", None, {"jac_sparsity": patron(), "vectorized": True})]:
+            yield "sistemas", "newton_multidimensional", backend, n, solver(n, J, **kw)
+
+
+def casos_multistart(quick):
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    # 8/ej8.py no es un módulo importable; se carga desde su ruta
+    spec = spec_from_file_location("ej8", ROOT.parent / "8" / "ej8.py")
+    ej8 = module_from_spec(spec)
+    spec.loader.exec_module(ej8)
+    F_sys, J_sys = ej8.F_sys, ej8.J_sys
+
+    for m in ([100, 1000] if quick else [100, 1000, 10000]):
+        X0 = instancias.puntos_iniciales(m)
+
+        def batch(X0=X0):
+            _, iters, _, _ = newton_multidimensional_batch(F_sys, J_sys, X0)
+            return {"iterations": int(iters.sum())}
+
+        def loop(X0=X0):
+            total = 0
+            for x0 in X0:
+                try:
+                    xs, _ = newton_multidimensional(F_sys, J_sys, x0)
+                except RuntimeError:
+                    continue
+                total += len(xs) - 1
+            return {"iterations": total}
+
+        yield "multistart", "F_sys", "batch", m, batch
+        if m <= 1000:
+            yield "multistart", "F_sys", "loop", m, loop
+
+
+def _con_fases(resolver):
+    """Ejecuta un modelo de PuLP y agrega el tiempo de cada fase."""
+    def run():
+        tracer = MemoryTracer()
+        resolver(tracer)
+        return {f"phase_{p['phase']}": p["seconds"] for p in tracer.phases}
+    return run
+
+
+def casos_modelos(quick):
+    import pulp
+
+    def cbc():
+        return pulp.PULP_CBC_CMD(msg=0)
+
+    for k in ([5, 20] if quick else [5, 20, 50]):
+        oferta, demanda, costos = instancias.red_transporte(k, k)
+        yield "modelos", "transporte", "cbc", k, _con_fases(
+            lambda tr, o=oferta, d=demanda, c=costos:
+                transporte(o, d, c, solver=cbc(), tracer=tr))
+
+    for n in ([5, 10] if quick else [5, 10, 20, 40]):
+        costos = instancias.matriz_costos(n, n + 1)
+        yield "modelos", "asignacion", "cbc", n, _con_fases(
+            lambda tr, c=costos: asignacion(c, solver=cbc(), tracer=tr))
+
+
+SUITES = {
+    "raices": casos_raices,
+    "sistemas": casos_sistemas,
+    "multistart": casos_multistart,
+    "modelos": casos_modelos,
+}
+
+
+# -------------------------
+# Comparación con el baseline
+# -------------------------
+def _clave(r):
+    return f"{r['suite']}/{r['solver']}/{r['backend']}/{r['size']}"
+
+
+def comparar(resultados, baseline, threshold):
+    """Devuelve la lista de regresiones (textos) frente al baseline."""
+    base = {_clave(r): r for r in baseline}
+    regresiones = []
+    for r in resultados:
+        b = base.get(_clave(r))
+        if b is None:
+            continue
+        for c in COUNTERS:
+            if c in r and c in b and r[c] > b[c]:
+                regresiones.append(f"{_clave(r)}: {c} {b[c]} -> {r[c]}")
+        for c, piso in (("time", 0.010), ("peak_kib", 64)):
+            if r[c] > threshold * b[c] and r[c] - b[c] > piso:
+                regresiones.append(
+                    f"{_clave(r)}: {c} {b[c]:.4g} -> {r[c]:.4g} "
+                    f"(x{r[c] / b[c]:.2f})")
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true",
+                        help="sólo tamaños pequeños")
+    parser.add_argument("--only", default=",".join(SUITES),
+                        help="suites separadas por coma: " + ", ".join(SUITES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="archivo JSON para los resultados")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="escribe los resultados en --baseline")
+    parser.add_argument("--threshold", type=float, default=2.0,
+                        help="factor de tiempo/memoria tolerado")
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter("ignore")
+    resultados = []
+    for suite in args.only.split(","):
+        for suite_, solver, backend, size, run in SUITES[suite](args.quick):
+            r = {"suite": suite_, "solver": solver, "backend": backend,
+                 "size": size, **measure(run, args.repeat)}
+            resultados.append(r)
+            extra = [f"{c}={r[c]}" for c in COUNTERS if c in r]
+            extra += [f"{c[6:]}={r[c]*1000:.2f}ms" for c in r
+                      if c.startswith("phase_")]
+            print(f"{_clave(r):55s} {r['time']*1000:10.2f} ms "
+                  f"{r['peak_kib']:10.1f} KiB  " + " ".join(extra), flush=True)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(resultados, indent=1))
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(resultados, indent=1))
+        print(f"\nBaseline guardado en {args.baseline}")
+        return 0
+
+    if not Path(args.baseline).exists():
+        print(f"\nSin baseline en {args.baseline}; use --save-baseline")
+        return 0
+    regresiones = comparar(resultados,
+                           json.loads(Path(args.baseline).read_text()),
+                           args.threshold)
+    if regresiones:
+        print("\nREGRESIONES:")
+        for texto in regresiones:
+            print("  " + texto)
+        return 1
+    print("\nSin regresiones frente al baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
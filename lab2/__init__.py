@@ -0,0 +1,61 @@
+"""
+Núcleo numérico del laboratorio 2.
+
+    pip install -e .            # núcleo (numpy)
+    pip install -e ".[all]"     # + scipy, matplotlib y PuLP
+
+    from lab2 import bisection, secant, newton, newton_multidimensional
+
+Importar el paquete no ejecuta cálculos ni carga matplotlib. Los métodos
+escalares no dependen de numpy; numpy sólo se carga al acceder por primera
+vez a newton_multidimensional, matplotlib al llamar a plot_convergence y
+PuLP al construir un modelo (transporte, asignacion); scipy, matplotlib y
+PuLP son extras opcionales (sparse, plot, lp). Todos los métodos
+aceptan tracer= para telemetría por iteración (ver lab2.telemetria).
+
+Objetivo de importación en frío (python -X importtime -c "import lab2"):
+menos de 5 ms para el paquete y los métodos escalares.
+"""
+from .raices import bisection, secant, newton, scan_brackets, find_roots
+
+__all__ = [
+    "bisection",
+    "secant",
+    "newton",
+    "scan_brackets",
+    "find_roots",
+    "newton_multidimensional",
+    "newton_multidimensional_batch",
+    "plot_convergence",
+    "transporte",
+    "asignacion",
+    "Tracer",
+    "MemoryTracer",
+    "JSONLinesTracer",
+]
+
+# Atributos que se cargan bajo demanda: nombre -> submódulo
+_LAZY = {
+    "newton_multidimensional": "sistemas",
+    "newton_multidimensional_batch": "sistemas",
+    "plot_convergence": "graficas",
+    "transporte": "modelos",
+    "asignacion": "modelos",
+    "Tracer": "telemetria",
+    "MemoryTracer": "telemetria",
+    "JSONLinesTracer": "telemetria",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+
+        value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
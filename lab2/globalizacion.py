@@ -0,0 +1,100 @@
+"""
+Globalización de Newton para sistemas: búsqueda lineal con retroceso
+sobre φ(x) = ‖F(x)‖² y región de confianza dogleg.
+
+Ambas aceptan sólo pasos que reducen ‖F‖², de modo que desde puntos
+iniciales lejanos el método no diverge y gasta menos iteraciones.
+"""
+import numpy as np
+
+
+def backtrack(F, x, d, Fx, slope, counts, f_ref=None, alpha=1e-4,
+              max_backtracks=30):
+    """
+    Búsqueda lineal de Armijo sobre φ(t) = ‖F(x + t d)‖².
+    Parámetros:
+      - F, x, Fx: la función, el punto y F(x) ya evaluada
+      - d: dirección de descenso
+      - slope: φ'(0) (= -2‖F‖² para la dirección de Newton)
+      - counts: contadores; cada prueba suma uno a counts["nfev"]
+      - f_ref: valor de referencia de ‖F‖² para la condición de Armijo; con
+        el máximo de las últimas iteraciones la búsqueda es no monótona
+        (None = ‖F(x)‖²)
+    Devuelve:
+      - t: fracción aceptada del paso, o None si no hubo descenso suficiente
+      - Ft: F(x + t d) en el último intento
+    El paso se reduce por interpolación cuadrática, acotada a [0.1 t, 0.5 t].
+    """
+    f0 = Fx @ Fx
+    if f_ref is None:
+        f_ref = f0
+    t = 1.0
+    for _ in range(max_backtracks):
+        Ft = F(x + t * d)
+        counts["nfev"] += 1
+        ft = Ft @ Ft
+        if np.isfinite(ft) and ft <= f_ref + alpha * t * slope:
+            return t, Ft
+        if np.isfinite(ft):
+            denom = ft - f0 - slope * t
+            t_new = -slope * t * t / (2 * denom) if denom > 0 else 0.5 * t
+            t = min(max(t_new, 0.1 * t), 0.5 * t)
+        else:
+            t *= 0.1
+    return None, Ft
+
+
+def dogleg(F, x, Fx, Jx, d_newton, radius, counts, max_tries=30):
+    """
+    Paso dogleg de región de confianza para min ½‖F‖².
+    Parámetros:
+      - F, x, Fx: la función, el punto y F(x) ya evaluada
+      - Jx: Jacobiano en x (denso o disperso)
+      - d_newton: paso de Newton, o None si J es singular (se usa el punto
+        de Cauchy)
+      - radius: radio actual de la región de confianza
+      - counts: contadores; cada prueba suma uno a counts["nfev"]
+    Devuelve:
+      - p: paso aceptado, o None si se rechazaron todos los intentos
+      - Fp: F(x + p) en el último intento
+      - radius: radio actualizado para la siguiente iteración
+    Los pasos rechazados reducen el radio sin reevaluar J.
+    """
+    g = Jx.T @ Fx
+    Jg = Jx @ g
+    gg = g @ g
+    JgJg = Jg @ Jg
+    p_cauchy = -(gg / JgJg) * g if JgJg > 0 else -g
+    norm_c = np.linalg.norm(p_cauchy)
+    norm_n = np.linalg.norm(d_newton) if d_newton is not None else np.inf
+    f0 = Fx @ Fx
+
+    for _ in range(max_tries):
+        if norm_n <= radius:
+            p = d_newton
+        elif norm_c >= radius:
+            p = (radius / norm_c) * p_cauchy
+        elif d_newton is None:
+            p = p_cauchy
+        else:
+            # τ ∈ (0, 1] con ‖p_c + τ (d_N - p_c)‖ = radio
+            v = d_newton - p_cauchy
+            a, b, c = v @ v, 2 * (p_cauchy @ v), norm_c**2 - radius**2
+            tau = (-b + np.sqrt(b * b - 4 * a * c)) / (2 * a)
+            p = p_cauchy + tau * v
+        norm_p = np.linalg.norm(p)
+
+        Fp = F(x + p)
+        counts["nfev"] += 1
+        model = Fx + Jx @ p
+        predicted = f0 - model @ model
+        actual = f0 - Fp @ Fp if np.all(np.isfinite(Fp)) else -np.inf
+        rho = actual / predicted if predicted > 0 else -1.0
+
+        if rho < 0.25:
+            radius = 0.25 * norm_p
+        elif rho > 0.75 and norm_p >= 0.99 * radius:
+            radius = 2 * radius
+        if rho > 1e-4:
+            return p, Fp, radius
+    return None, Fp, radius
@@ -0,0 +1,34 @@
+"""
+Gráficas de convergencia. matplotlib es opcional y sólo se importa al graficar.
+"""
+
+
+def _pyplot():
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise ImportError(
+            "Las gráficas requieren matplotlib (pip install matplotlib)"
+        ) from exc
+    return plt
+
+
+def plot_convergence(series, title="Comparación de métodos", show=True):
+    """
+    Grafica las aproximaciones sucesivas de uno o varios métodos.
+    Parámetros:
+      - series: lista de tuplas (etiqueta, aproximaciones, marcador)
+      - title: título de la gráfica
+      - show: si es True llama a plt.show()
+    """
+    plt = _pyplot()
+    for label, approximations, marker in series:
+        plt.plot(approximations, label=label, marker=marker)
+    plt.xlabel("Iteración")
+    plt.ylabel("Aproximación")
+    plt.title(title)
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    if show:
+        plt.show()
@@ -0,0 +1,90 @@
+"""
+Jacobianos por diferencias finitas.
+
+Sin patrón de dispersión se necesita una evaluación de F por columna. Con
+un patrón, las columnas que no comparten ninguna fila se agrupan (coloreo
+voraz del grafo de intersección de columnas) y cada grupo se estima con
+una sola evaluación de F: un Jacobiano tridiagonal necesita 3, sea cual
+sea n. Si F está vectorizada (acepta un lote (m, n), como en
+newton_multidimensional_batch) todos los grupos se evalúan en una llamada.
+"""
+import numpy as np
+
+from .lineal import issparse
+
+
+def color_columns(sparsity):
+    """
+    Agrupa las columnas de un patrón de dispersión (n×n, denso o
+    scipy.sparse) de forma que dos columnas del mismo grupo no tengan
+    elementos no nulos en la misma fila.
+    Devuelve:
+      - groups: array (n,) con el grupo de cada columna (0, 1, ...)
+    """
+    # grafo de intersección de columnas: j ~ k si comparten alguna fila
+    if issparse(sparsity):
+        A = sparsity.tocsc().astype(bool).astype(np.int32)
+        G = (A.T @ A).tocsr()
+        indptr, indices = G.indptr.tolist(), G.indices.tolist()
+    else:
+        A = np.asarray(sparsity, dtype=bool).astype(np.int64)
+        G = (A.T @ A) != 0
+        adjacency = [np.flatnonzero(row).tolist() for row in G]
+        indptr = np.cumsum([0] + [len(a) for a in adjacency]).tolist()
+        indices = [k for a in adjacency for k in a]
+
+    # coloreo voraz en orden natural (óptimo para patrones en banda)
+    n = len(indptr) - 1
+    groups = [-1] * n
+    for j in range(n):
+        used = {groups[k] for k in indices[indptr[j]:indptr[j + 1]]}
+        g = 0
+        while g in used:
+            g += 1
+        groups[j] = g
+    return np.array(groups, dtype=int)
+
+
+def _steps(x):
+    return np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+
+
+def fd_jacobian(F, x, Fx, sparsity=None, groups=None, vectorized=False):
+    """
+    Estima J(x) por diferencias finitas hacia adelante.
+    Parámetros:
+      - F, x, Fx: la función, el punto y F(x) ya evaluada
+      - sparsity: patrón n×n de J (denso o scipy.sparse); None = denso
+      - groups: resultado de color_columns(sparsity), para no recalcularlo
+      - vectorized: si F acepta un lote (m, n) y devuelve (m, n)
+    Devuelve:
+      - Jx: array n×n, o matriz CSC si se dio sparsity
+      - nfev: evaluaciones de F realizadas
+    """
+    n = x.size
+    h = _steps(x)
+    if sparsity is None:
+        groups = np.arange(n)
+    elif groups is None:
+        groups = color_columns(sparsity)
+    ngroups = int(groups.max()) + 1 if n else 0
+
+    # una fila de perturbaciones por grupo
+    P = np.zeros((ngroups, n))
+    P[groups, np.arange(n)] = h
+    if vectorized:
+        DF = F(x + P) - Fx
+        nfev = 1
+    else:
+        DF = np.array([F(x + p) - Fx for p in P])
+        nfev = ngroups
+
+    if sparsity is None:
+        return DF.T / h, nfev
+
+    from scipy.sparse import coo_matrix
+
+    pattern = coo_matrix(sparsity)
+    rows, cols = pattern.row, pattern.col
+    values = DF[groups[cols], rows] / h[cols]
+    return coo_matrix((values, (rows, cols)), shape=(n, n)).tocsc(), nfev
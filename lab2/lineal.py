@@ -0,0 +1,110 @@
+"""
+Resolución de los sistemas lineales J · d = r dentro de Newton.
+
+Soporta Jacobianos densos (numpy), dispersos (scipy.sparse, factorizados
+con splu) y métodos de Krylov (gmres, lgmres, bicgstab) sobre matrices o
+LinearOperator, incluido el producto J·v libre de matriz por diferencias
+finitas. scipy es opcional: sólo se importa cuando se usa algo disperso o
+un método de Krylov.
+"""
+import sys
+import warnings
+
+import numpy as np
+
+KRYLOV = ("gmres", "lgmres", "bicgstab")
+LINEAR_SOLVERS = ("direct",) + KRYLOV
+
+
+def issparse(A):
+    """True si A es una matriz de scipy.sparse (sin importar scipy)."""
+    if "scipy.sparse" not in sys.modules:
+        return False
+    return sys.modules["scipy.sparse"].issparse(A)
+
+
+def islinearoperator(A):
+    """True si A es un scipy.sparse.linalg.LinearOperator (sin importar scipy)."""
+    if "scipy.sparse.linalg" not in sys.modules:
+        return False
+    return isinstance(A, sys.modules["scipy.sparse.linalg"].LinearOperator)
+
+
+def factorize(Jx):
+    """
+    Factoriza Jx una vez y devuelve una función que resuelve Jx · d = r.
+    Densa: scipy.linalg.lu_factor si está disponible; si no, la inversa.
+    Dispersa: scipy.sparse.linalg.splu sobre la matriz en formato CSC.
+    Lanza np.linalg.LinAlgError si Jx es singular.
+    """
+    if issparse(Jx):
+        from scipy.sparse.linalg import splu
+
+        try:
+            lu = splu(Jx.tocsc())
+        except RuntimeError as exc:  # "Factor is exactly singular"
+            raise np.linalg.LinAlgError(str(exc)) from exc
+        return lu.solve
+
+    try:
+        from scipy.linalg import lu_factor, lu_solve
+    except ImportError:
+        Jinv = np.linalg.inv(Jx)
+        return lambda r: Jinv @ r
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # la singularidad se reporta abajo
+        lu, piv = lu_factor(Jx, check_finite=False)
+    if not np.all(np.diag(lu)):
+        raise np.linalg.LinAlgError("Singular matrix")
+    return lambda r: lu_solve((lu, piv), r, check_finite=False)
+
+
+def fd_operator(F, x, Fx, counts):
+    """
+    LinearOperator con J(x)·v ≈ (F(x + h v) - F(x)) / h.
+    Cada producto cuesta una evaluación de F, que se suma a counts["nfev"].
+    """
+    from scipy.sparse.linalg import LinearOperator
+
+    n = x.size
+    scale = np.sqrt(np.finfo(float).eps) * (1 + np.linalg.norm(x))
+
+    def matvec(v):
+        v = np.ravel(v)
+        nv = np.linalg.norm(v)
+        if nv == 0:
+            return np.zeros(n)
+        h = scale / nv
+        counts["nfev"] += 1
+        return (F(x + h * v) - Fx) / h
+
+    return LinearOperator((n, n), matvec=matvec, dtype=float)
+
+
+def krylov_solver(A, method, counts, maxiter=200):
+    """
+    Devuelve una función que resuelve A · d = r con el método de Krylov
+    indicado. La tolerancia relativa sigue el término forzante
+    min(0.1, ‖r‖) (Newton inexacto), acotado por abajo en 1e-6 porque un
+    producto J·v por diferencias finitas no da más precisión; las
+    iteraciones internas se suman a counts["nlin"]. Si no converge en
+    maxiter se devuelve la mejor aproximación y Newton sigue iterando.
+    """
+    import scipy.sparse.linalg as spla
+
+    krylov = getattr(spla, method)
+
+    def solve(r):
+        def callback(_):
+            counts["nlin"] += 1
+
+        rtol = max(min(0.1, float(np.linalg.norm(r))), 1e-6)
+        kwargs = {"callback_type": "pr_norm"} if method == "gmres" else {}
+        d, status = krylov(A, r, rtol=rtol, atol=0.0, maxiter=maxiter,
+                           callback=callback, **kwargs)
+        if status < 0:
+            raise np.linalg.LinAlgError(f"{method} falló (código {status})")
+        return d
+
+    return solve
@@ -0,0 +1,126 @@
+"""
+Modelos de programación lineal con PuLP: transporte y asignación.
+
+Cada función separa las fases "build" (construcción del modelo), "solve"
+(llamada al solver) y "extract" (lectura de la solución), que se reportan
+al tracer si se da uno. PuLP sólo se importa al construir un modelo.
+"""
+from .telemetria import phase
+
+
+def transporte(oferta, demanda, costos, costos_camion=None, solver=None,
+               tracer=None):
+    """
+    Problema de transporte: minimizar el costo de enviar desde los orígenes
+    (oferta ≤ capacidad) hasta los destinos (demanda exacta).
+    Parámetros:
+      - oferta: dict origen -> capacidad
+      - demanda: dict destino -> demanda
+      - costos: dict (origen, destino) -> costo unitario; sólo existen las
+        rutas presentes
+      - costos_camion: dict opcional de rutas alternativas (camión) con su
+        costo unitario; comparten la capacidad del origen
+      - solver: solver de PuLP (None = el predeterminado)
+      - tracer: lab2.telemetria.Tracer
+    Devuelve un dict con:
+      - status: estado de PuLP ("Optimal", "Infeasible", ...)
+      - envios, envios_camion: dict ruta -> cantidad enviada
+      - costo: valor de la función objetivo
+    """
+    import pulp as pl
+
+    costos_camion = costos_camion or {}
+    name = "transporte"
+
+    with phase(tracer, name, "build"):
+        model = pl.LpProblem("Transporte", pl.LpMinimize)
+        x = pl.LpVariable.dicts("x", costos, lowBound=0)
+        y = pl.LpVariable.dicts("y", costos_camion, lowBound=0)
+
+        model += (
+            pl.lpSum(x[r] * costos[r] for r in costos) +
+            pl.lpSum(y[r] * costos_camion[r] for r in costos_camion)
+        )
+
+        salidas = {i: [] for i in oferta}
+        llegadas = {j: [] for j in demanda}
+        for (i, j), var in list(x.items()) + list(y.items()):
+            salidas[i].append(var)
+            llegadas[j].append(var)
+        for i in oferta:
+            model += pl.lpSum(salidas[i]) <= oferta[i], f"Oferta_{i}"
+        for j in demanda:
+            model += pl.lpSum(llegadas[j]) == demanda[j], f"Demanda_{j}"
+
+    with phase(tracer, name, "solve"):
+        model.solve(solver)
+
+    with phase(tracer, name, "extract"):
+        return {
+            "status": pl.LpStatus[model.status],
+            "envios": {r: var.varValue for r, var in x.items()},
+            "envios_camion": {r: var.varValue for r, var in y.items()},
+            "costo": pl.value(model.objective),
+        }
+
+
+def asignacion(costos, exacta=False, solver=None, tracer=None):
+    """
+    Problema de asignación: cada trabajador (fila) recibe exactamente un
+    trabajo (columna); cada trabajo se asigna a lo sumo a un trabajador, o
+    exactamente a uno si exacta=True.
+    Parámetros:
+      - costos: matriz (lista de listas) trabajadores × trabajos
+      - exacta: si los trabajos también deben quedar todos asignados
+      - solver: solver de PuLP (None = el predeterminado)
+      - tracer: lab2.telemetria.Tracer
+    Devuelve un dict con:
+      - status: estado de PuLP
+      - matriz: lista de listas con 1 si i se asigna a j y 0 si no
+      - asignaciones: lista de (i, j, costo) con índices desde 0
+      - costo: costo total de la asignación
+    """
+    import pulp
+
+    trabajadores = range(len(costos))
+    trabajos = range(len(costos[0]))
+    name = "asignacion"
+
+    with phase(tracer, name, "build"):
+        problema = pulp.LpProblem("Problema_Asignacion", pulp.LpMinimize)
+
+        x = {}
+        for i in trabajadores:
+            for j in trabajos:
+                x[i, j] = pulp.LpVariable(f"x_{i+1}_{j+1}", cat='Binary')
+
+        problema += pulp.lpSum([costos[i][j] * x[i, j]
+                               for i in trabajadores
+                               for j in trabajos]), "Costo_Total"
+
+        for i in trabajadores:
+            problema += pulp.lpSum([x[i, j] for j in trabajos]) == 1, \
+                f"Trabajador_{i+1}_asignado"
+
+        for j in trabajos:
+            columna = pulp.lpSum([x[i, j] for i in trabajadores])
+            if exacta:
+                problema += columna == 1, f"Trabajo_{j+1}_asignado"
+            else:
+                problema += columna <= 1, f"Trabajo_{j+1}_maximo_uno"
+
+    with phase(tracer, name, "solve"):
+        problema.solve(solver)
+
+    with phase(tracer, name, "extract"):
+        matriz = [[int(round(x[i, j].varValue or 0)) for j in trabajos]
+                  for i in trabajadores]
+        asignaciones = [(i, j, costos[i][j])
+                        for i in trabajadores for j in trabajos
+                        if matriz[i][j] == 1]
+        return {
+            "status": pulp.LpStatus[problema.status],
+            "matriz": matriz,
+            "asignaciones": asignaciones,
+            "costo": sum(c for _, _, c in asignaciones),
+        }
@@ -0,0 +1,290 @@
+"""
+Métodos para encontrar raíces de funciones f: R → R.
+
+Todos devuelven (approximations, root) donde approximations es la lista de
+aproximaciones sucesivas. El módulo no depende de numpy ni de matplotlib.
+Con tracer (ver lab2.telemetria) se reporta cada iteración.
+
+Singularidades: bisection rechaza los intervalos cuyo cambio de signo es un
+polo (p. ej. g(x) = x**2 + 1/(x-7) en x = 7) lanzando ValueError, y los
+tres métodos aceptan singularities=[...] con polos conocidos, que nunca se
+cruzan. scan_brackets y find_roots recorren un dominio partiéndolo en
+ellos.
+"""
+import math
+
+
+def _straddles(x0, x1, singularities):
+    """True si alguna singularidad queda entre x0 y x1 (inclusive)."""
+    return any((x0 - s) * (x1 - s) <= 0 for s in singularities)
+
+
+def _stay_on_side(x0, x1, singularities, max_halvings=60):
+    """Acorta el paso x0 → x1 a la mitad hasta no cruzar ninguna singularidad."""
+    for _ in range(max_halvings):
+        if not _straddles(x0, x1, singularities):
+            break
+        x1 = (x0 + x1) / 2
+    return x1
+
+
+def _evaluate(f, x):
+    """f(x), o None si f no está definida en x (error, ±inf o nan)."""
+    try:
+        fx = f(x)
+    except (ZeroDivisionError, OverflowError):
+        return None
+    return fx if math.isfinite(fx) else None
+
+
+# -------------------------
+# MÉTODO DE BISECCIÓN
+# -------------------------
+def bisection(f, a, b, max_iter=100, tol=1e-7, tracer=None, singularities=(),
+              pole_checks=5):
+    """
+    Un cambio de signo puede venir de un polo y no de una raíz. Cerca de
+    una raíz simple |f| es proporcional a la distancia y |f|·(b - a)
+    disminuye a un cuarto en cada iteración; cerca de un polo |f| crece al
+    menos como 1/distancia y |f|·(b - a) no disminuye. Si esto ocurre en
+    pole_checks iteraciones seguidas, se lanza ValueError en lugar de
+    converger al polo (pole_checks=0 desactiva la prueba).
+    singularities: polos conocidos; si alguno está en [a, b] se lanza
+    ValueError sin evaluar f.
+    """
+    for s in singularities:
+        if a <= s <= b or b <= s <= a:
+            raise ValueError(f"[a, b] contiene la singularidad x = {s}")
+    fa = f(a)
+    fb = f(b)
+    if fa * fb >= 0:
+        raise ValueError("f(a) y f(b) deben tener signos opuestos")
+
+    approximations = []
+    growth = 0
+    if tracer is not None:
+        t0 = tracer.start("bisection")
+
+    for k in range(max_iter):
+        c = (a + b) / 2
+        approximations.append(c)
+
+        fc = _evaluate(f, c)
+        if fc is None:
+            raise ValueError(f"f no está definida en x = {c} (polo)")
+        if tracer is not None:
+            tracer.iteration("bisection", t0, k, abs(fc), abs(b - a) / 2,
+                             nfev=k + 3, x=c)
+        if abs(fc) < tol or abs(b - a) / 2 < tol:
+            return approximations, c
+
+        # |f|·(b - a) no disminuye: |f| al menos se duplica en el punto
+        # medio respecto del extremo que reemplaza
+        if fa * fc < 0:
+            grows = abs(fc) >= 2 * abs(fb)
+            b, fb = c, fc
+        else:
+            grows = abs(fc) >= 2 * abs(fa)
+            a, fa = c, fc
+
+        growth = growth + 1 if grows else 0
+        if pole_checks and growth >= pole_checks:
+            raise ValueError(f"el cambio de signo en [a, b] es un polo "
+                             f"cerca de x = {c}, no una raíz")
+
+    return approximations, c
+
+
+# -------------------------
+# MÉTODO DE LA SECANTE
+# -------------------------
+def secant(f, x0, x1, max_iter=100, tol=1e-7, tracer=None, singularities=()):
+    """
+    singularities: polos conocidos; ningún paso los cruza (se acorta a la
+    mitad hasta quedar del mismo lado).
+    """
+    if _straddles(x0, x1, singularities):
+        raise ValueError("x0 y x1 están separados por una singularidad")
+    approximations = [x0, x1]
+    fx0 = f(x0)
+    fx1 = f(x1)
+    if tracer is not None:
+        t0 = tracer.start("secant")
+
+    for k in range(max_iter):
+        if abs(fx1 - fx0) < 1e-12:
+            break  # evitar división por cero
+
+        x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+        if singularities:
+            x2 = _stay_on_side(x1, x2, singularities)
+        approximations.append(x2)
+        if tracer is not None:
+            tracer.iteration("secant", t0, k, abs(fx1), abs(x2 - x1),
+                             nfev=k + 2, x=x2)
+
+        if abs(x2 - x1) < tol:
+            return approximations, x2
+
+        x0, x1 = x1, x2
+        fx0, fx1 = fx1, f(x2)
+
+    return approximations, approximations[-1]
+
+
+# -------------------------
+# MÉTODO DE NEWTON-RAPHSON
+# -------------------------
+def _backtrack(f, x0, fx0, step, alpha=1e-4, max_halvings=30):
+    """
+    Reduce el paso a la mitad hasta que |f| baje lo suficiente (Armijo).
+    Devuelve el nuevo punto, f en él y las evaluaciones de f realizadas.
+    """
+    t = 1.0
+    for i in range(max_halvings):
+        x1 = x0 - t * step
+        try:
+            fx1 = f(x1)
+        except (ZeroDivisionError, OverflowError):
+            fx1 = math.inf
+        if abs(fx1) <= (1 - alpha * t) * abs(fx0):
+            break
+        t /= 2
+    return x1, fx1, i + 1
+
+
+def newton(f, df, x0, max_iter=100, tol=1e-7, line_search=False,
+           tracer=None, singularities=()):
+    """
+    Con line_search=True cada paso se recorta hasta que |f| disminuye, lo
+    que evita divergir desde puntos iniciales lejanos. La convergencia se
+    sigue midiendo sobre el paso de Newton completo. Si f'(x) se anula se
+    usa un paso de secante en lugar de detenerse, y se lanza RuntimeError
+    si tampoco la secante tiene pendiente.
+    singularities: polos conocidos; ningún paso los cruza.
+    """
+    approximations = [x0]
+    fx0 = f(x0)
+    fprev = None  # f en el iterado anterior (paso de secante)
+    nfev = 1
+    if tracer is not None:
+        t0 = tracer.start("newton")
+
+    for k in range(max_iter):
+        dfx = df(x0)
+        if abs(dfx) < 1e-12:
+            if not line_search:
+                break  # evitar división por cero
+            # derivada nula: paso de secante con el iterado anterior o, en
+            # la primera iteración, con un punto de prueba a distancia
+            # max(1, |x0|)
+            if fprev is not None and approximations[-2] != x0:
+                xp, fxp = approximations[-2], fprev
+            else:
+                xp = _stay_on_side(x0, x0 + max(1.0, abs(x0)), singularities)
+                fxp = f(xp)
+                nfev += 1
+            dfx = (fx0 - fxp) / (x0 - xp)
+            if abs(dfx) < 1e-12:
+                raise RuntimeError(f"derivada nula en x = {x0}: newton no "
+                                   "puede continuar")
+
+        step = fx0 / dfx
+        x1 = x0 - step
+        if singularities and _straddles(x0, x1, singularities):
+            x1 = _stay_on_side(x0, x1, singularities)
+            step = x0 - x1
+        if line_search and abs(x1 - x0) >= tol:
+            x1, fx1, evals = _backtrack(f, x0, fx0, step)
+            nfev += evals
+            approximations.append(x1)
+        else:
+            approximations.append(x1)
+            if abs(x1 - x0) < tol:
+                if tracer is not None:
+                    tracer.iteration("newton", t0, k, abs(fx0), abs(x1 - x0),
+                                     nfev=nfev, njev=k + 1, x=x1)
+                return approximations, x1
+            fx1 = f(x1)
+            nfev += 1
+
+        if tracer is not None:
+            tracer.iteration("newton", t0, k, abs(fx0), abs(x1 - x0),
+                             nfev=nfev, njev=k + 1, x=x1)
+        x0, fx0, fprev = x1, fx1, fx0
+
+    return approximations, approximations[-1]
+
+
+# -------------------------
+# BÚSQUEDA EN UN DOMINIO
+# -------------------------
+def _split(l, r, singularities, margin):
+    """
+    Tramos de [l, r] que quedan al quitar (s - δ, s + δ) alrededor de cada
+    singularidad s, con δ = margin · max(1, |s|).
+    """
+    tramos = []
+    inicio = l
+    for s in sorted(s for s in singularities if l <= s <= r):
+        delta = margin * max(1.0, abs(s))
+        if s - delta > inicio:
+            tramos.append((inicio, s - delta))
+        inicio = max(inicio, s + delta)
+    if r > inicio:
+        tramos.append((inicio, r))
+    return tramos
+
+
+def scan_brackets(f, a, b, n=100, singularities=(), margin=1e-9):
+    """
+    Recorre [a, b] con una malla de n subintervalos y devuelve los
+    intervalos (l, r) donde f cambia de signo. Las singularidades conocidas
+    parten el dominio en tramos [.., s - δ] y [s + δ, ..] con
+    δ = margin · max(1, |s|), de modo que f nunca se evalúa en un polo ni
+    se reporta un cambio de signo a través de él. Un punto x de la malla
+    donde f no está definida se trata como una singularidad más: se
+    reemplaza por x - δ y x + δ, sin unir los dos lados. Una raíz que cae
+    justo en un punto de la malla se reporta como (x, x).
+    """
+    brackets = []
+    for l, r in _split(a, b, singularities, margin):
+        m = max(1, round(n * (r - l) / (b - a)))
+        puntos = []  # (x, f(x)) en orden; None corta el tramo
+        for x in (l + (r - l) * i / m for i in range(m + 1)):
+            fx = _evaluate(f, x)
+            if fx is not None:
+                puntos.append((x, fx))
+                continue
+            # polo no declarado en la malla: se sustituye por x ± δ
+            delta = margin * max(1.0, abs(x))
+            for y in (x - delta, None, x + delta):
+                fy = None if y is None or not l <= y <= r else _evaluate(f, y)
+                puntos.append(None if fy is None else (y, fy))
+        for p, q in zip(puntos, puntos[1:] + [None]):
+            if p is None:
+                continue
+            if p[1] == 0:
+                brackets.append((p[0], p[0]))
+            elif q is not None and p[1] * q[1] < 0:
+                brackets.append((p[0], q[0]))
+    return brackets
+
+
+def find_roots(f, a, b, n=100, singularities=(), tol=1e-7, max_iter=100):
+    """
+    Raíces reales de f en [a, b]: scan_brackets seguido de bisection en
+    cada intervalo. Los intervalos que bisection identifica como polos se
+    descartan.
+    """
+    roots = []
+    for l, r in scan_brackets(f, a, b, n, singularities):
+        if l == r:
+            roots.append(l)
+            continue
+        try:
+            _, root = bisection(f, l, r, max_iter=max_iter, tol=tol)
+        except ValueError:
+            continue  # polo no declarado
+        roots.append(root)
+    return roots
@@ -0,0 +1,275 @@
+"""
+Método de Newton para sistemas de ecuaciones no lineales F: R^n → R^n.
+
+Además del Newton clásico hay dos modos que ahorran Jacobianos:
+  - "chord": reutiliza la factorización LU de J durante varias iteraciones
+    (método de la cuerda / Shamanskii).
+  - "broyden": actualiza una aproximación de J^{-1} con correcciones de
+    rango uno (Broyden "bueno") sin volver a evaluar J.
+En ambos el Jacobiano sólo se recalcula cuando la convergencia se estanca.
+
+J(x) puede ser densa o dispersa (scipy.sparse); para sistemas grandes se
+puede resolver con Krylov (linear_solver="gmres", ...) y, con
+matrix_free=True, sin construir J (ver lab2.lineal). Con J=None el
+Jacobiano se estima por diferencias finitas, agrupando columnas si se da
+su patrón de dispersión (ver lab2.jacobiano). globalization="line_search"
+o "dogleg" protege contra la divergencia desde puntos iniciales lejanos
+(ver lab2.globalizacion).
+"""
+import numpy as np
+
+from .globalizacion import backtrack, dogleg
+from .jacobiano import color_columns, fd_jacobian
+from .lineal import (LINEAR_SOLVERS, factorize, fd_operator, islinearoperator,
+                     issparse, krylov_solver)
+from .telemetria import phase
+
+METHODS = ("newton", "chord", "broyden")
+GLOBALIZATIONS = (None, "line_search", "dogleg")
+NONMONOTONE = 5  # iteraciones que se recuerdan en la búsqueda lineal
+
+
+def newton_multidimensional(F, J, x0, tol=1e-7, max_iter=100, method="newton",
+                            max_reuse=None, stall_ratio=0.5, full_output=False,
+                            linear_solver="direct", matrix_free=False,
+                            jac_sparsity=None, vectorized=False,
+                            globalization=None, tracer=None):
+    """
+    Método de Newton para funciones F: R^n → R^n.
+    Parámetros:
+      - F: función que toma un vector x (n,) y devuelve un vector F(x) (n,)
+      - J: función que toma x y devuelve la matriz Jacobiana J(x) (n×n),
+        densa (numpy), dispersa (scipy.sparse) o un LinearOperator (éste
+        sólo con un linear_solver de Krylov); None para estimarla por
+        diferencias finitas
+      - x0: punto inicial (array de longitud n)
+      - tol: tolerancia para la norma de la corrección
+      - max_iter: número máximo de iteraciones
+      - method: "newton", "chord" o "broyden"
+      - max_reuse: en "chord"/"broyden", número máximo de iteraciones con el
+        mismo Jacobiano (None = sin límite, sólo se refresca al estancarse)
+      - stall_ratio: se refresca J si ‖F(x_{k+1})‖ > stall_ratio · ‖F(x_k)‖
+      - full_output: si es True devuelve también el diccionario info
+      - linear_solver: "direct" (LU densa o splu dispersa) o un método de
+        Krylov: "gmres", "lgmres" o "bicgstab" (Newton-Krylov)
+      - matrix_free: con Krylov, usa J·v ≈ (F(x + h v) - F(x)) / h en lugar
+        de J (J puede ser None); memoria O(n)
+      - jac_sparsity: con J=None, patrón de dispersión n×n de J; las
+        columnas se agrupan por coloreo y J se estima con una evaluación
+        de F por grupo (devuelve una matriz dispersa)
+      - vectorized: con J=None, F acepta un lote (m, n) y todos los grupos
+        se evalúan en una sola llamada
+      - globalization: None (pasos completos), "line_search" (retroceso de
+        Armijo sobre ‖F‖²) o "dogleg" (región de confianza); con J singular
+        se toma un paso de máximo descenso en lugar de lanzar RuntimeError
+      - tracer: lab2.telemetria.Tracer; recibe cada iteración (‖F‖, ‖paso‖,
+        nfev, njev) y la duración de las fases "jacobian", "factorize" y
+        "linear_solve"
+    Devuelve:
+      - xs: lista de aproximaciones (cada elemento es un array de longitud n)
+      - x: aproximación final (array de longitud n)
+      - info (sólo con full_output): iteraciones, convergencia y contadores
+        nfev (llamadas a F, incluidas las de diferencias finitas), njev
+        (Jacobianos evaluados o estimados), nfact (factorizaciones) y nlin
+        (iteraciones de Krylov)
+    """
+    if method not in METHODS:
+        raise ValueError(f"method debe ser uno de {METHODS}, no {method!r}")
+    if linear_solver not in LINEAR_SOLVERS:
+        raise ValueError(
+            f"linear_solver debe ser uno de {LINEAR_SOLVERS}, no {linear_solver!r}")
+    krylov = linear_solver != "direct"
+    if matrix_free and not krylov:
+        raise ValueError("matrix_free requiere un linear_solver de Krylov")
+    if method == "broyden" and krylov:
+        raise ValueError('method="broyden" requiere linear_solver="direct"')
+    if globalization not in GLOBALIZATIONS:
+        raise ValueError(
+            f"globalization debe ser uno de {GLOBALIZATIONS}, no {globalization!r}")
+    if globalization == "dogleg" and (krylov or method == "broyden"):
+        raise ValueError('globalization="dogleg" requiere J explícita: '
+                         'linear_solver="direct" y method distinto de "broyden"')
+
+    x = np.asarray(x0, dtype=float)
+    xs = [x.copy()]
+    Fx = F(x)
+    counts = {"nfev": 1, "njev": 0, "nfact": 0, "nlin": 0}
+    groups = None
+    if J is None and not matrix_free and jac_sparsity is not None:
+        groups = color_columns(jac_sparsity)  # una sola vez por llamada
+    solve = None
+    H = None  # aproximación de J^{-1} en modo "broyden"
+    radius = None  # radio de la región de confianza en modo "dogleg"
+    history = []  # ‖F‖² de las últimas iteraciones (búsqueda no monótona)
+    # con globalización, un J singular no detiene el método: se toma la
+    # dirección de máximo descenso de ½‖F‖², que requiere J explícita
+    descent_fallback = globalization is not None and not krylov \
+        and method != "broyden"
+    since_refresh = 0
+    converged = False
+    k = -1
+    name = "newton_multidimensional"
+    if tracer is not None:
+        t0 = tracer.start(name)
+
+    for k in range(max_iter):
+        if (solve is None or method == "newton"
+                or (max_reuse is not None and since_refresh >= max_reuse)):
+            # liberar J y su factorización anteriores antes de las nuevas
+            Jx = solve = None
+            with phase(tracer, name, "jacobian"):
+                if matrix_free:
+                    Jx = fd_operator(F, x, Fx, counts)
+                elif J is None:
+                    Jx, nfev = fd_jacobian(F, x, Fx, jac_sparsity, groups,
+                                           vectorized)
+                    counts["nfev"] += nfev
+                    counts["njev"] += 1
+                else:
+                    Jx = J(x)
+                    counts["njev"] += 1
+                    if not krylov and islinearoperator(Jx):
+                        raise ValueError(
+                            "J devolvió un LinearOperator, que requiere un "
+                            'linear_solver de Krylov ("gmres", "lgmres" o '
+                            '"bicgstab")')
+            try:
+                with phase(tracer, name, "factorize"):
+                    if krylov:
+                        solve = krylov_solver(Jx, linear_solver, counts)
+                    elif method == "broyden":
+                        if issparse(Jx):
+                            raise ValueError(
+                                'method="broyden" no admite Jacobianos dispersos')
+                        H = np.linalg.inv(Jx)
+                        solve = lambda r: H @ r
+                    else:
+                        solve = factorize(Jx)
+            except np.linalg.LinAlgError:
+                if not descent_fallback:
+                    raise RuntimeError(f"Jacobiano singular en iteración {k}")
+                solve = None
+            else:
+                if not krylov:
+                    counts["nfact"] += 1
+            since_refresh = 0
+
+        # resolver J(x) · delta = -F(x)
+        newton_step = solve is not None
+        if newton_step:
+            try:
+                with phase(tracer, name, "linear_solve"):
+                    delta = solve(-Fx)
+            except np.linalg.LinAlgError:
+                if not descent_fallback:
+                    raise RuntimeError(f"Jacobiano singular en iteración {k}")
+                solve, newton_step = None, False
+        if not newton_step:
+            # Jacobiano singular: máximo descenso de ½‖F‖²
+            delta = -(Jx.T @ Fx)
+
+        Fx_new = None
+        step_norm = np.linalg.norm(delta, ord=2)
+        if step_norm >= tol:
+            if globalization == "line_search":
+                slope = -2 * (Fx @ Fx) if newton_step else -2 * (delta @ delta)
+                history.append(Fx @ Fx)
+                t, Fx_new = backtrack(F, x, delta, Fx, slope, counts,
+                                      f_ref=max(history[-NONMONOTONE:]))
+                if t is None:
+                    break  # sin descenso posible: mínimo local de ‖F‖
+                delta = t * delta
+            elif globalization == "dogleg":
+                if radius is None:
+                    radius = max(1.0, np.linalg.norm(x))
+                delta, Fx_new, radius = dogleg(
+                    F, x, Fx, Jx, delta if newton_step else None, radius, counts)
+                if delta is None:
+                    break  # la región de confianza colapsó sin descenso
+        x = x + delta
+        xs.append(x.copy())
+        since_refresh += 1
+        if tracer is not None:
+            tracer.iteration(name, t0, k, np.linalg.norm(Fx),
+                             np.linalg.norm(delta), counts["nfev"],
+                             counts["njev"])
+        if step_norm < tol:
+            converged = newton_step
+            break
+
+        if Fx_new is None:
+            Fx_new = F(x)
+            counts["nfev"] += 1
+        if method != "newton":
+            if np.linalg.norm(Fx_new) > stall_ratio * np.linalg.norm(Fx):
+                solve = None  # estancado: refrescar J en la siguiente iteración
+            elif method == "broyden":
+                # actualización de Sherman-Morrison de H ≈ J^{-1}
+                y = Fx_new - Fx
+                Hy = H @ y
+                denom = delta @ Hy
+                if abs(denom) > 1e-14:
+                    H += np.outer(delta - Hy, delta @ H) / denom
+        Fx = Fx_new
+
+    if not full_output:
+        return xs, x
+    info = {"iterations": k + 1, "converged": converged, **counts}
+    return xs, x, info
+
+
+def newton_multidimensional_batch(F, J, X0, tol=1e-7, max_iter=100, args=()):
+    """
+    Newton para m puntos iniciales a la vez (multi-start vectorizado).
+    Parámetros:
+      - F: función que toma X (m, n) y devuelve F(X) (m, n)
+      - J: función que toma X (m, n) y devuelve los Jacobianos (m, n, n)
+      - X0: puntos iniciales, array (m, n)
+      - tol: tolerancia para la norma de la corrección de cada fila
+      - max_iter: número máximo de iteraciones
+      - args: tupla de arrays con primera dimensión m (p. ej. un juego de
+        parámetros por fila); se pasan a F y J como F(X, *args)
+    Devuelve:
+      - X: aproximaciones finales (m, n)
+      - iterations: iteraciones realizadas por cada fila (m,)
+      - converged: máscara de filas que alcanzaron la tolerancia (m,)
+      - singular: máscara de filas detenidas por Jacobiano singular (m,)
+    En cada iteración se evalúan F y J sólo sobre las filas activas y se
+    hace un único np.linalg.solve apilado; las filas singulares se marcan y
+    se retiran en lugar de lanzar una excepción, y las que divergen a
+    valores no finitos se retiran sin marcarse como convergidas.
+    """
+    X = np.array(X0, dtype=float, ndmin=2)
+    m = X.shape[0]
+    args = tuple(np.asarray(a) for a in args)
+    iterations = np.zeros(m, dtype=int)
+    converged = np.zeros(m, dtype=bool)
+    singular = np.zeros(m, dtype=bool)
+    active = np.arange(m)
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        Xa = X[active]
+        a_args = tuple(a[active] for a in args)
+        Fx = F(Xa, *a_args)
+        Jx = J(Xa, *a_args)
+        # resolver J(x) · delta = -F(x) para todas las filas activas
+        try:
+            delta = np.linalg.solve(Jx, -Fx[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            sign, _ = np.linalg.slogdet(Jx)
+            bad = sign == 0
+            singular[active[bad]] = True
+            ok = ~bad
+            active, Xa, Fx, Jx = active[ok], Xa[ok], Fx[ok], Jx[ok]
+            delta = np.linalg.solve(Jx, -Fx[..., None])[..., 0]
+
+        X[active] = Xa + delta
+        iterations[active] += 1
+        step = np.linalg.norm(delta, axis=1)
+        done = step < tol
+        converged[active[done]] = True
+        active = active[np.isfinite(step) & ~done]  # descartar filas divergentes
+
+    return X, iterations, converged, singular
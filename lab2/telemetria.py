@@ -0,0 +1,118 @@
+"""
+Telemetría de los solvers.
+
+Todos los métodos aceptan tracer=None. Con None no se mide nada: el costo
+es una comparación por iteración y, en newton_multidimensional y los
+modelos de PuLP, entrar y salir de un contexto vacío por fase (~1 µs;
+tres por iteración en newton_multidimensional). Con un Tracer se reciben:
+  - on_iteration(record): un diccionario por iteración con solver, k,
+    x (escalares), residual (|f| o ‖F‖), step (tamaño del paso), nfev,
+    njev y time (segundos desde el inicio)
+  - on_phase(solver, name, seconds): duración de cada fase, p. ej.
+    "build", "solve" y "extract" en los modelos de PuLP
+
+    from lab2.telemetria import JSONLinesTracer
+    with JSONLinesTracer("traza.jsonl") as tracer:
+        newton(f, df, 1.5, tracer=tracer)
+"""
+import json
+import time
+from contextlib import nullcontext
+
+_NULL_PHASE = nullcontext()
+
+
+class Tracer:
+    """Tracer base: no hace nada. Se redefinen los métodos on_*."""
+
+    def on_iteration(self, record):
+        pass
+
+    def on_phase(self, solver, name, seconds):
+        pass
+
+    def start(self, solver):
+        """Marca el inicio de un solver; devuelve el reloj de referencia."""
+        return time.perf_counter()
+
+    def iteration(self, solver, t0, k, residual, step, nfev, njev=0, x=None):
+        record = {
+            "solver": solver,
+            "k": k,
+            "residual": float(residual),
+            "step": float(step),
+            "nfev": nfev,
+            "njev": njev,
+            "time": time.perf_counter() - t0,
+        }
+        if x is not None:
+            record["x"] = float(x)
+        self.on_iteration(record)
+
+    def phase(self, solver, name):
+        return _Phase(self, solver, name)
+
+
+class _Phase:
+    def __init__(self, tracer, solver, name):
+        self.tracer, self.solver, self.name = tracer, solver, name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.on_phase(self.solver, self.name,
+                             time.perf_counter() - self.t0)
+        return False
+
+
+def phase(tracer, solver, name):
+    """tracer.phase(...) o un contexto vacío si tracer es None."""
+    return _NULL_PHASE if tracer is None else tracer.phase(solver, name)
+
+
+class MemoryTracer(Tracer):
+    """Guarda los eventos en memoria (listas iterations y phases)."""
+
+    def __init__(self):
+        self.iterations = []
+        self.phases = []
+
+    def on_iteration(self, record):
+        self.iterations.append(record)
+
+    def on_phase(self, solver, name, seconds):
+        self.phases.append({"solver": solver, "phase": name,
+                            "seconds": seconds})
+
+
+class JSONLinesTracer(Tracer):
+    """
+    Escribe cada evento como una línea JSON en un archivo (ruta o archivo
+    abierto). Se usa como context manager para cerrar el archivo.
+    """
+
+    def __init__(self, path_or_file):
+        if hasattr(path_or_file, "write"):
+            self.file, self._owns = path_or_file, False
+        else:
+            self.file, self._owns = open(path_or_file, "a", encoding="utf-8"), True
+
+    def on_iteration(self, record):
+        self.file.write(json.dumps({"event": "iteration", **record}) + "\n")
+
+    def on_phase(self, solver, name, seconds):
+        self.file.write(json.dumps({"event": "phase", "solver": solver,
+                                    "phase": name, "seconds": seconds}) + "\n")
+
+    def close(self):
+        if self._owns:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
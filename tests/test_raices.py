@@ -0,0 +1,73 @@
+"""
+Pruebas de la detección de polos en lab2.raices (bisection, scan_brackets,
+find_roots). Cubren los dos errores ya corregidos en la heurística: falsos
+polos en funciones oscilantes y raíces perdidas junto a un polo de la malla.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from lab2 import bisection, find_roots
+
+ROOTS_G = [-0.3683948, 0.3889233, 6.9794717]
+
+
+def g(x):
+    """Función del ejercicio 5: polo en x = 7."""
+    return x**2 + 1 / (x - 7)
+
+
+def g_numpy(x):
+    """g con escalares de numpy: devuelve inf en el polo en lugar de fallar."""
+    x = np.float64(x)
+    with np.errstate(divide="ignore"):
+        return x**2 + 1 / (x - 7)
+
+
+def counted(f):
+    def wrapped(x):
+        wrapped.nfev += 1
+        return f(x)
+    wrapped.nfev = 0
+    return wrapped
+
+
+@pytest.mark.parametrize("a, b", [(6.99, 7.02), (6.98, 7.5), (6.995, 8),
+                                  (6.99, 7.01)])
+def test_bisection_rejects_pole_brackets(a, b):
+    f = counted(g)
+    with pytest.raises(ValueError, match="polo"):
+        bisection(f, a, b)
+    assert f.nfev < 20  # sin la prueba se converge al polo en 21-26
+
+
+def test_bisection_rejects_non_finite_midpoint():
+    with pytest.raises(ValueError, match="polo"):
+        bisection(g_numpy, 6.99, 7.01)
+
+
+@pytest.mark.parametrize("a, b, root", [(-2, 0, ROOTS_G[0]),
+                                        (6.9, 6.99, ROOTS_G[2])])
+def test_bisection_keeps_real_brackets(a, b, root):
+    _, r = bisection(g, a, b)
+    assert r == pytest.approx(root, abs=1e-6)
+
+
+def test_bisection_oscillating_function_is_not_a_pole():
+    def f(x):
+        return math.sin(20*x) + 0.3 * math.sin(60*x)
+    _, r = bisection(f, -1.57, 1.25)
+    assert r == pytest.approx(math.pi / 20, abs=1e-6)
+
+
+@pytest.mark.parametrize("singularities", [(), (7,)])
+@pytest.mark.parametrize("n", [100, 200])
+def test_find_roots_g(singularities, n):
+    # con n = 100 y n = 200 la malla tiene un nodo exactamente en x = 7
+    roots = find_roots(g, -10, 10, n=n, singularities=singularities)
+    assert roots == pytest.approx(ROOTS_G, abs=1e-6)
+
+
+def test_find_roots_non_finite_grid_point():
+    assert find_roots(g_numpy, -10, 10) == pytest.approx(ROOTS_G, abs=1e-6)